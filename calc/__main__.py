@@ -1,24 +1,49 @@
-import os
 import sys
-import stat
+import string
 import argparse
+import functools
 import calc
-from calc.interpreter import Interpreter, ParserError
 
 
-def interpret(text):
-    """Pass input ``text`` to a new ``Interpreter``.
+@functools.lru_cache(maxsize=256)
+def _evaluate(text):
+    """Evaluate ``text`` without creating an ``Interpreter``.
+
+    Note:
+        Results are memoized, so repeated expressions are only parsed once.
 
     Args:
-        text (str): The text to be interpreted.
+        text (str): The text to be evaluated.
+
+    Returns:
+        result (int or str): The result of the expression, or the error
+            message if it could not be parsed.
     """
 
-    interpreter = Interpreter(text)
+    # Deferred so that --help and --version never load the interpreter.
+    from calc.interpreter import ParserError, parse
+
     try:
-        result = interpreter.parse()
-        print(result)
+        return parse(text)
     except ParserError as error:
-        print(error)
+        return str(error)
+
+
+def interpret(text):
+    """Interpret input ``text`` and print the result.
+
+    Args:
+        text (str): The text to be interpreted.
+    """
+
+    # A bare integer evaluates to itself, so skip the interpreter entirely.
+    # Only ASCII digits and whitespace qualify, matching the tokenizer.
+    stripped = text.strip(string.whitespace)
+    if stripped and not stripped.strip(string.digits):
+        print(int(stripped))
+        return
+
+    print(_evaluate(text))
 
 
 def main():
@@ -27,12 +52,16 @@ def main():
                             version=calc.__version__)
     arg_parser.parse_args()
 
-    # If input is coming from stdin interpret that, otherwise be interactive.
-    # Much thanks to Stack Overflow: http://stackoverflow.com/a/13443424/3288364
-    mode = os.fstat(0).st_mode
-    if stat.S_ISFIFO(mode):
-        text = ''.join(line for line in sys.stdin)
-        interpret(text)
+    # If input is piped or redirected into stdin interpret that, otherwise be
+    # interactive.
+    if not sys.stdin.isatty():
+        for line in sys.stdin:
+            text = line.rstrip('\n')
+
+            if not text.strip():
+                continue
+
+            interpret(text)
     else:
         while True:
             try:
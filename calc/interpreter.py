@@ -1,22 +1,64 @@
-# EOF (end-of-file) indicates no more input for lexical analysis.
-INTEGER, PLUS, MINUS, EOF = 'INTEGER', 'PLUS', 'MINUS', 'EOF'
+import re
+import operator
+import functools
+
+# EOF (end-of-file) indicates no more input for lexical analysis. Kinds are
+# plain integers so they compare cheaply; their names are kept for messages.
+INTEGER, PLUS, MINUS, EOF = range(4)
+_KIND_NAMES = {INTEGER: 'INTEGER', PLUS: 'PLUS', MINUS: 'MINUS', EOF: 'EOF'}
+
+# Matches a single lexeme: a run of whitespace, an integer, or an operator.
+# Input is restricted to ASCII so the character classes avoid Unicode lookups.
+_TOKEN_RE = re.compile(r'\s+|(\d+)|([+\-])', re.ASCII)
 
 
 class ParserError(Exception):
-    """Exception raised when the parser encounters an error."""
-    pass
+    """Exception raised when the parser encounters an error.
+
+    Note:
+        When ``fields`` are given the message is only formatted when the error
+        is converted to a string, so errors that are raised and then discarded
+        never pay for it. Both ``message`` and ``fields`` are kept in ``args``.
+
+    Attributes:
+        message (str): A message describing the error. If ``fields`` are given
+            it is a ``str.format`` template for them.
+        fields (dict): The values to substitute into ``message``.
+    """
+
+    def __init__(self, message, **fields):
+        if fields:
+            super().__init__(message, fields)
+        else:
+            super().__init__(message)
+        self.message = message
+        self.fields = fields
+
+    def __str__(self):
+        """The human readable string representation of a ``ParserError``."""
+
+        if self.fields:
+            return self.message.format(**self.fields)
+        return self.message
+
+    def __reduce__(self):
+        """Rebuild the ``ParserError`` and its fields when pickled."""
+
+        return (functools.partial(type(self), **self.fields), (self.message,))
 
 
 class Token:
     """A calculator token.
 
     Attributes:
-        kind (str): The kind, or type, of the token. Valid kinds are currently
+        kind (int): The kind, or type, of the token. Valid kinds are currently
             ``INTEGER``, ``PLUS``, ``MINUS``, and ``EOF``.
         value (str): The value of the token. Valid values are currently
             non-negative integers, ``+``, ``-``, or ``None``.
     """
 
+    __slots__ = ('kind', 'value')
+
     def __init__(self, kind, value):
         self.kind = kind
         self.value = value
@@ -24,33 +66,130 @@ class Token:
     def __repr__(self):
         """The unambiguous string representation of a ``Token``."""
 
-        return "Token({kind}, {value})".format(kind=self.kind,
+        return "Token({kind}, {value})".format(kind=_KIND_NAMES[self.kind],
                                                value=repr(self.value))
 
     def __eq__(self, other):
         """Test ``Token`` equality."""
 
-        if self.kind == other.kind and self.value == other.value:
-            return True
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self.kind == other.kind and self.value == other.value
+
+
+# Tokens whose value never varies are shared rather than allocated per lexeme.
+_PLUS_TOKEN = Token(PLUS, '+')
+_MINUS_TOKEN = Token(MINUS, '-')
+_EOF_TOKEN = Token(EOF, None)
+
+# The token and binary operation for each operator lexeme. Supporting a new
+# operator means adding it to _TOKEN_RE and an entry to each of these.
+_OPERATOR_TOKENS = {'+': _PLUS_TOKEN, '-': _MINUS_TOKEN}
+_OPERATIONS = {'+': operator.add, '-': operator.sub}
+
+
+def _unexpected_token(expected_kind, found_kind, pos):
+    """Create the ``ParserError`` for a token of the wrong kind.
+
+    Args:
+        expected_kind (int): The kind of token the parser expected.
+        found_kind (int): The kind of token the parser found instead.
+        pos (int): The position in the input just past the found token.
+
+    Returns:
+        error (ParserError): The error describing the unexpected token.
+    """
+
+    return ParserError("Expected {token_kind} at position {pos}, "
+                       "found {current_token}",
+                       token_kind=_KIND_NAMES[expected_kind],
+                       pos=pos,
+                       current_token=_KIND_NAMES[found_kind])
+
+
+def parse(text):
+    """Parse and evaluate the arithmetic expression in ``text``.
+
+    Note:
+        Valid expressions are currently of the form
+            INTEGER ((PLUS | MINUS) INTEGER)*
+        e.g. ``'4'``, ``'4 + 3'``, or ``'4 + 3 - 2'``. Lexemes are matched
+        directly and all parser state is held in local variables, so no
+        ``Token`` instances are created.
+
+    Args:
+        text (str): The text to be parsed.
+
+    Returns:
+        result (int): The result of evaluating the arithmetic expression.
+
+    Raises:
+        ParserError: If ``text`` is not a valid expression.
+    """
+
+    match_token = _TOKEN_RE.match
+    pos = 0
+    end = len(text)
+
+    # The first term is added to zero, so every term is handled alike.
+    result = 0
+    operation = operator.add
+    expecting_term = True
+
+    while pos < end:
+        match = match_token(text, pos)
+
+        if match is None:
+            raise ParserError("Invalid token at position {pos}", pos=pos)
+
+        pos = match.end()
+        integer, op = match.groups()
+
+        # Whitespace separates tokens but is otherwise ignored.
+        if integer is None and op is None:
+            continue
+
+        # A term must follow the start of input and every operator.
+        if expecting_term:
+            if integer is None:
+                raise _unexpected_token(INTEGER, _OPERATOR_TOKENS[op].kind,
+                                        pos)
+            result = operation(result, int(integer))
+            expecting_term = False
+
+        # An operator after a term selects the operation for the next term.
+        elif op is not None:
+            operation = _OPERATIONS[op]
+            expecting_term = True
+
+        # Anything else after a term ends the expression.
         else:
-            return False
+            return result
+
+    if expecting_term:
+        raise _unexpected_token(INTEGER, EOF, pos)
+
+    return result
 
 
 class Interpreter:
     """An interpreter for a simple calculator.
 
+    Note:
+        ``parse`` delegates to the module level ``parse`` function, which does
+        not update ``pos`` or ``current_token``.
+
     Attributes:
         text (str): The input string, e.g. ``'3+5'``.
         pos (int): An index into ``text`` indicating the intepreter's position.
         current_token (Token): The current ``Token`` instance.
-        current_char (str): The character in ``text`` indexed by ``pos``.
     """
 
     def __init__(self, text):
         self.text = text
         self.pos = 0
+        self._text_end = len(text)
         self.current_token = None
-        self.current_char = self.text[self.pos] if self.text else None
 
     def __repr__(self):
         """The unambiguous string representation of an ``Interpreter``."""
@@ -61,37 +200,6 @@ class Interpreter:
             current_token=repr(self.current_token)
         )
 
-    def _advance(self):
-        """Advance the ``pos`` index and set the ``current_char`` variable."""
-
-        self.pos += 1
-        if self.pos > len(self.text) - 1:
-            self.current_char = None
-        else:
-            self.current_char = self.text[self.pos]
-
-    def _skip_whitespace(self):
-        """Ignore whitespace in ``text``."""
-
-        while self.current_char is not None and self.current_char.isspace():
-            self._advance()
-
-    def _integer(self):
-        """Consume a integer from ``text``.
-
-        Note:
-            Handles single and multidigit integers.
-
-        Returns:
-            result (int): The integer value of a contiguous set of digits.
-        """
-
-        result = []
-        while self.current_char is not None and self.current_char.isdigit():
-            result.append(self.current_char)
-            self._advance()
-        return int(''.join(result))
-
     def _get_next_token(self):
         """Tokenize the next token in the input string.
 
@@ -103,45 +211,37 @@ class Interpreter:
                 the invalid token is also given by this ``ParserError``.
         """
 
-        while self.current_char is not None:
+        while self.pos < self._text_end:
+            match = _TOKEN_RE.match(self.text, self.pos)
 
-            # If the current character is a space, then ignore it and any
-            # additional spaces until the next token of consequence.
-            if self.current_char.isspace():
-                self._skip_whitespace()
-                continue
+            if match is None:
+                raise ParserError("Invalid token at position {pos}",
+                                  pos=self.pos)
 
-            # If the current character is a digit, then convert it to an
-            # integer, create an INTEGER token, advance self.pos, and return the
-            # INTEGER token.
-            if self.current_char.isdigit():
-                return Token(INTEGER, self._integer())
+            self.pos = match.end()
 
-            # If the current character is a + operator, then create a PLUS
-            # token, advance self.pos, and return the PLUS token.
-            if self.current_char == '+':
-                self._advance()
-                return Token(PLUS, '+')
+            # If the match is an integer, then create an INTEGER token from its
+            # value and return it.
+            integer, op = match.groups()
+            if integer is not None:
+                return Token(INTEGER, int(integer))
 
-            # If the current character is a - operator, then create a MINUS
-            # token, advance self.pos, and return the MINUS token.
-            if self.current_char == '-':
-                self._advance()
-                return Token(MINUS, '-')
+            # If the match is an operator, then return its token.
+            if op is not None:
+                return _OPERATOR_TOKENS[op]
 
-            raise ParserError("Invalid token at position {pos}".format(
-                pos=self.pos
-            ))
+            # Otherwise the match was whitespace, so ignore it and continue on
+            # to the next token of consequence.
 
-        # If the current character is None, then self.pos is beyond the end of
-        # self.text. We should return EOF, because nothing remains to tokenize.
-        return Token(EOF, None)
+        # If self.pos is beyond the end of self.text, then we should return
+        # EOF, because nothing remains to tokenize.
+        return _EOF_TOKEN
 
     def _consume(self, token_kind):
         """Consume the current token if its kind matches ``token_kind``.
 
         Args:
-            token_kind (str): The expected kind of the current_token. Valid
+            token_kind (int): The expected kind of the current_token. Valid
                 kinds are currently ``INTEGER``, ``PLUS``, and ``EOF``.
 
         Raises:
@@ -152,51 +252,14 @@ class Interpreter:
         if self.current_token.kind == token_kind:
             self.current_token = self._get_next_token()
         else:
-            raise ParserError(("Expected {token_kind} at position {pos}, "
-                               "found {current_token}").format(
-                                   token_kind=token_kind,
-                                   pos=self.pos,
-                                   current_token=self.current_token.kind))
-
-    def _term(self):
-        """Return the value of an ``INTEGER`` token.
-
-        Returns:
-            token.value (int): The value of the ``INTEGER`` token.
-        """
-
-        token = self.current_token
-        self._consume(INTEGER)
-        return token.value
+            raise _unexpected_token(token_kind, self.current_token.kind,
+                                    self.pos)
 
     def parse(self):
         """Parse arithmetic expressions.
 
-        Note:
-            Valid expressions are currently of the form
-                INTEGER PLUS INTEGER
-            or
-                INTEGER MINUS INTEGER
-
         Returns:
             result (int): The result of evaluating the arithmetic expression.
         """
 
-        # Get the first token.
-        self.current_token = self._get_next_token()
-
-        # Get the first term.
-        result = self._term()
-
-        # As long as the next token is an operator consume it and then perform
-        # the corresponding operation on the next term.
-        while self.current_token.kind in (PLUS, MINUS):
-            token = self.current_token
-            if token.kind == PLUS:
-                self._consume(PLUS)
-                result = result + self._term()
-            elif token.kind == MINUS:
-                self._consume(MINUS)
-                result = result - self._term()
-
-        return result
+        return parse(self.text)
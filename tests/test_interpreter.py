@@ -1,6 +1,9 @@
+import copy
+import pickle
 import unittest
 
-from calc.interpreter import INTEGER, PLUS, Token, Interpreter, ParserError
+from calc.interpreter import (INTEGER, PLUS, EOF, Token, Interpreter,
+                             ParserError, parse)
 
 
 class TestInterpreter(unittest.TestCase):
@@ -23,6 +26,15 @@ class TestInterpreter(unittest.TestCase):
         interpreter = Interpreter('a')
         self.assertRaises(ParserError, interpreter._get_next_token)
 
+    def test_raises_parser_error_on_repeated_invalid_input(self):
+        interpreter = Interpreter('4 + a')
+        interpreter._get_next_token()
+        interpreter._get_next_token()
+
+        for _ in range(2):
+            self.assertRaises(ParserError, interpreter._get_next_token)
+            self.assertEqual(interpreter.pos, 4)
+
     def test_raises_parser_error_on_unexpected_token(self):
         # Instantiate an "empty" ``Interpreter`` and manually set its token.
         interpreter = Interpreter('')
@@ -30,3 +42,46 @@ class TestInterpreter(unittest.TestCase):
 
         # Assert a ``ParserError`` is raised if the wrong token is consumed.
         self.assertRaises(ParserError, interpreter._consume, PLUS)
+
+    def test_tokenizes_multidigit_integers_and_whitespace(self):
+        interpreter = Interpreter('  42\t+ 108 ')
+        self.assertEqual(interpreter._get_next_token(), Token(INTEGER, 42))
+        self.assertEqual(interpreter._get_next_token(), Token(PLUS, '+'))
+        self.assertEqual(interpreter._get_next_token(), Token(INTEGER, 108))
+        self.assertEqual(interpreter._get_next_token(), Token(EOF, None))
+
+    def test_unexpected_token_error_names_token_kinds(self):
+        interpreter = Interpreter('')
+        interpreter.current_token = Token(INTEGER, 0)
+
+        with self.assertRaisesRegex(ParserError, 'Expected PLUS.*INTEGER'):
+            interpreter._consume(PLUS)
+
+    def test_raises_parser_error_on_non_ascii_digits(self):
+        interpreter = Interpreter('٤ + 3')
+        self.assertRaises(ParserError, interpreter._get_next_token)
+
+    def test_parser_error_formats_message_from_fields(self):
+        error = ParserError("Invalid token at position {pos}", pos=3)
+        self.assertEqual(str(error), 'Invalid token at position 3')
+        self.assertEqual(error.args,
+                         ("Invalid token at position {pos}", {'pos': 3}))
+
+    def test_parser_error_without_fields_is_not_formatted(self):
+        error = ParserError("literal {brace}")
+        self.assertEqual(str(error), 'literal {brace}')
+        self.assertEqual(error.args, ("literal {brace}",))
+
+    def test_parser_error_survives_pickle_and_copy(self):
+        error = ParserError("Invalid token at position {pos}", pos=3)
+        for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+            self.assertIsInstance(clone, ParserError)
+            self.assertEqual(clone.args, error.args)
+            self.assertEqual(str(clone), 'Invalid token at position 3')
+
+    def test_token_does_not_equal_other_types(self):
+        self.assertNotEqual(Token(INTEGER, 0), (INTEGER, 0))
+
+    def test_parse_function(self):
+        self.assertEqual(parse('10 - 4 + 1'), 7)
+        self.assertRaises(ParserError, parse, '10 -')
@@ -0,0 +1,58 @@
+import io
+import unittest
+from unittest import mock
+
+from calc.__main__ import _evaluate, interpret, main
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        # Results are memoized, so start every test with an empty cache.
+        _evaluate.cache_clear()
+
+    def run_interpret(self, text):
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            interpret(text)
+        return stdout.getvalue()
+
+    def run_main(self, stdin):
+        with mock.patch('sys.argv', ['calc']), \
+                mock.patch('sys.stdin', io.StringIO(stdin)), \
+                mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            main()
+        return stdout.getvalue()
+
+    def test_interpret_expression(self):
+        self.assertEqual(self.run_interpret('4 + 3 - 2'), '5\n')
+
+    def test_interpret_bare_integer_skips_evaluate(self):
+        self.assertEqual(self.run_interpret(' 42\t'), '42\n')
+        self.assertEqual(_evaluate.cache_info().misses, 0)
+
+    def test_interpret_negative_integer_is_an_error(self):
+        self.assertEqual(self.run_interpret('-5'),
+                         'Expected INTEGER at position 1, found MINUS\n')
+
+    def test_interpret_non_ascii_digits_are_an_error(self):
+        self.assertEqual(self.run_interpret('٤٢'),
+                         'Invalid token at position 0\n')
+
+    def test_interpret_invalid_token(self):
+        self.assertEqual(self.run_interpret('4 + a'),
+                         'Invalid token at position 4\n')
+
+    def test_interpret_missing_term(self):
+        self.assertEqual(self.run_interpret('4 +'),
+                         'Expected INTEGER at position 3, found EOF\n')
+
+    def test_interpret_memoizes_results(self):
+        self.run_interpret('4 + 3')
+        self.assertEqual(self.run_interpret('4 + 3'), '7\n')
+        self.assertEqual(_evaluate.cache_info().hits, 1)
+
+    def test_main_interprets_each_piped_line(self):
+        output = self.run_main('4 + 3\n\n  \n\r\n10 - 2\nx\n5')
+        self.assertEqual(output, '7\n8\nInvalid token at position 0\n5\n')
+
+    def test_main_ignores_empty_piped_input(self):
+        self.assertEqual(self.run_main(''), '')